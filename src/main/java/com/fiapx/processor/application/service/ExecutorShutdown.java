@@ -0,0 +1,37 @@
+package com.fiapx.processor.application.service;
+
+import java.time.Duration;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.TimeUnit;
+
+/**
+ * Encerramento gracioso dos pools de transferência: as tarefas em andamento terminam
+ * antes que o S3Client seja fechado pelo Spring.
+ */
+final class ExecutorShutdown {
+
+    // Cabe no período de encerramento padrão do Kubernetes (30s)
+    static final Duration DRAIN_TIMEOUT = Duration.ofSeconds(20);
+
+    private ExecutorShutdown() {
+    }
+
+    /**
+     * Aguarda o término das tarefas de cada pool, na ordem informada, dentro de um prazo comum.
+     * As que não terminarem no prazo são interrompidas.
+     */
+    static void drain(ExecutorService... executors) {
+        long deadline = System.nanoTime() + DRAIN_TIMEOUT.toNanos();
+        for (ExecutorService executor : executors) {
+            executor.shutdown();
+            try {
+                if (!executor.awaitTermination(deadline - System.nanoTime(), TimeUnit.NANOSECONDS)) {
+                    executor.shutdownNow();
+                }
+            } catch (InterruptedException e) {
+                executor.shutdownNow();
+                Thread.currentThread().interrupt();
+            }
+        }
+    }
+}
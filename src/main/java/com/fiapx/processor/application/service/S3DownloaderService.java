@@ -1,16 +1,36 @@
 package com.fiapx.processor.application.service;
 
+import jakarta.annotation.PreDestroy;
 import org.springframework.stereotype.Service;
+import software.amazon.awssdk.core.ResponseInputStream;
 import software.amazon.awssdk.services.s3.S3Client;
 import software.amazon.awssdk.services.s3.model.GetObjectRequest;
+import software.amazon.awssdk.services.s3.model.GetObjectResponse;
+import software.amazon.awssdk.services.s3.model.HeadObjectRequest;
 
 import java.io.File;
+import java.io.IOException;
+import java.io.RandomAccessFile;
+import java.io.UncheckedIOException;
+import java.nio.ByteBuffer;
+import java.nio.channels.FileChannel;
 import java.nio.file.Paths;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
 
 @Service
 public class S3DownloaderService {
 
+    // Objetos acima deste tamanho são baixados em faixas (Range) paralelas
+    private static final long PART_SIZE = 8L * 1024 * 1024;
+    private static final int MAX_CONCURRENCY = 8;
+
     private final S3Client s3Client;
+    private final ExecutorService partExecutor = Executors.newFixedThreadPool(MAX_CONCURRENCY);
 
     public S3DownloaderService(S3Client s3Client) {
         this.s3Client = s3Client;
@@ -18,6 +38,7 @@ public class S3DownloaderService {
 
     /**
      * Faz o download de um arquivo do S3 para um diretório local temporário.
+     * Arquivos grandes são divididos em faixas de bytes baixadas em paralelo.
      * @param bucketName O nome do bucket.
      * @param key A chave do objeto no S3.
      * @return O arquivo local baixado.
@@ -26,12 +47,88 @@ public class S3DownloaderService {
         File localFile = new File("/tmp/downloads/" + key);
         localFile.getParentFile().mkdirs();
 
+        long contentLength = s3Client.headObject(HeadObjectRequest.builder()
+                .bucket(bucketName)
+                .key(key)
+                .build()).contentLength();
+
+        if (contentLength <= PART_SIZE) {
+            GetObjectRequest getObjectRequest = GetObjectRequest.builder()
+                    .bucket(bucketName)
+                    .key(key)
+                    .build();
+
+            s3Client.getObject(getObjectRequest, Paths.get(localFile.getAbsolutePath()));
+            return localFile;
+        }
+
+        try {
+            downloadInRanges(bucketName, key, localFile, contentLength);
+        } catch (RuntimeException e) {
+            localFile.delete();
+            throw e;
+        }
+        return localFile;
+    }
+
+    private void downloadInRanges(String bucketName, String key, File localFile, long contentLength) {
+        try (RandomAccessFile raf = new RandomAccessFile(localFile, "rw")) {
+            // Pré-aloca o arquivo para que cada faixa seja gravada diretamente na sua posição
+            raf.setLength(contentLength);
+            FileChannel channel = raf.getChannel();
+
+            List<Future<Void>> ranges = new ArrayList<>();
+            for (long start = 0; start < contentLength; start += PART_SIZE) {
+                long rangeStart = start;
+                long rangeEnd = Math.min(start + PART_SIZE, contentLength) - 1;
+                ranges.add(partExecutor.submit(() -> {
+                    downloadRange(bucketName, key, channel, rangeStart, rangeEnd);
+                    return null;
+                }));
+            }
+            awaitAll(ranges);
+        } catch (IOException e) {
+            throw new UncheckedIOException("Falha ao gravar o arquivo baixado: " + localFile.getAbsolutePath(), e);
+        }
+    }
+
+    private void downloadRange(String bucketName, String key, FileChannel channel, long start, long end) throws IOException {
         GetObjectRequest getObjectRequest = GetObjectRequest.builder()
                 .bucket(bucketName)
                 .key(key)
+                .range("bytes=" + start + "-" + end)
                 .build();
 
-        s3Client.getObject(getObjectRequest, Paths.get(localFile.getAbsolutePath()));
-        return localFile;
+        try (ResponseInputStream<GetObjectResponse> in = s3Client.getObject(getObjectRequest)) {
+            byte[] buffer = new byte[64 * 1024];
+            long position = start;
+            int length;
+            while ((length = in.read(buffer)) != -1) {
+                ByteBuffer chunk = ByteBuffer.wrap(buffer, 0, length);
+                while (chunk.hasRemaining()) {
+                    position += channel.write(chunk, position);
+                }
+            }
+        }
+    }
+
+    private void awaitAll(List<Future<Void>> ranges) {
+        try {
+            for (Future<Void> range : ranges) {
+                range.get();
+            }
+        } catch (InterruptedException e) {
+            ranges.forEach(range -> range.cancel(true));
+            Thread.currentThread().interrupt();
+            throw new IllegalStateException("Download interrompido", e);
+        } catch (ExecutionException e) {
+            ranges.forEach(range -> range.cancel(true));
+            throw new IllegalStateException("Falha no download de uma das faixas do arquivo", e.getCause());
+        }
+    }
+
+    @PreDestroy
+    void shutdown() {
+        ExecutorShutdown.drain(partExecutor);
     }
 }
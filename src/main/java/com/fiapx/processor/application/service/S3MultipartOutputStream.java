@@ -0,0 +1,253 @@
+package com.fiapx.processor.application.service;
+
+import software.amazon.awssdk.core.sync.RequestBody;
+import software.amazon.awssdk.services.s3.S3Client;
+import software.amazon.awssdk.services.s3.model.AbortMultipartUploadRequest;
+import software.amazon.awssdk.services.s3.model.CompleteMultipartUploadRequest;
+import software.amazon.awssdk.services.s3.model.CompletedMultipartUpload;
+import software.amazon.awssdk.services.s3.model.CompletedPart;
+import software.amazon.awssdk.services.s3.model.CreateMultipartUploadRequest;
+import software.amazon.awssdk.services.s3.model.PutObjectRequest;
+import software.amazon.awssdk.services.s3.model.UploadPartRequest;
+
+import java.io.ByteArrayInputStream;
+import java.io.IOException;
+import java.io.InterruptedIOException;
+import java.io.OutputStream;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Future;
+import java.util.concurrent.Semaphore;
+import java.util.concurrent.atomic.AtomicBoolean;
+
+/**
+ * OutputStream que envia os bytes escritos diretamente para o S3, sem arquivo intermediário.
+ * Cada parte completa é enviada em paralelo via multipart upload; conteúdos menores que uma
+ * parte são enviados com um único PutObject.
+ * Cada buffer de parte consome uma permissão do semáforo compartilhado, limitando a memória
+ * retida por todos os uploads do processo.
+ * O objeto só é publicado por {@link #complete()}: fechar o stream (por exemplo, ao encerrar
+ * um ZipOutputStream após uma falha) não conclui o upload.
+ */
+class S3MultipartOutputStream extends OutputStream {
+
+    private final S3Client s3Client;
+    private final ExecutorService partExecutor;
+    private final String bucketName;
+    private final String key;
+    private final int partSize;
+    private final Semaphore bufferPermits;
+
+    private final List<Part> parts = new ArrayList<>();
+    // Alocado sob demanda, apenas enquanto houver permissão para mais uma parte em memória
+    private byte[] buffer;
+    private int position;
+    private String uploadId;
+    private boolean finished;
+
+    S3MultipartOutputStream(S3Client s3Client, ExecutorService partExecutor, String bucketName, String key,
+                            int partSize, Semaphore bufferPermits) {
+        this.s3Client = s3Client;
+        this.partExecutor = partExecutor;
+        this.bucketName = bucketName;
+        this.key = key;
+        this.partSize = partSize;
+        this.bufferPermits = bufferPermits;
+    }
+
+    @Override
+    public void write(int b) throws IOException {
+        ensureOpen();
+        ensureBuffer();
+        buffer[position++] = (byte) b;
+        if (position == partSize) {
+            uploadBufferedPart();
+        }
+    }
+
+    @Override
+    public void write(byte[] b, int off, int len) throws IOException {
+        ensureOpen();
+        while (len > 0) {
+            ensureBuffer();
+            int length = Math.min(len, partSize - position);
+            System.arraycopy(b, off, buffer, position, length);
+            position += length;
+            off += length;
+            len -= length;
+            if (position == partSize) {
+                uploadBufferedPart();
+            }
+        }
+    }
+
+    @Override
+    public void close() {
+        // Intencionalmente vazio: veja complete() e abort()
+    }
+
+    /**
+     * Envia as partes restantes e conclui o upload, publicando o objeto no S3.
+     */
+    void complete() throws IOException {
+        ensureOpen();
+        finished = true;
+
+        if (uploadId == null) {
+            PutObjectRequest objectRequest = PutObjectRequest.builder()
+                    .bucket(bucketName)
+                    .key(key)
+                    .build();
+            try {
+                byte[] content = buffer != null ? buffer : new byte[0];
+                s3Client.putObject(objectRequest, RequestBody.fromInputStream(new ByteArrayInputStream(content, 0, position), position));
+            } finally {
+                releaseBuffer();
+            }
+            return;
+        }
+
+        try {
+            if (position > 0) {
+                uploadBufferedPart();
+            } else {
+                releaseBuffer();
+            }
+            List<CompletedPart> completedParts = new ArrayList<>();
+            for (int i = 0; i < parts.size(); i++) {
+                completedParts.add(awaitPart(i));
+            }
+            s3Client.completeMultipartUpload(CompleteMultipartUploadRequest.builder()
+                    .bucket(bucketName)
+                    .key(key)
+                    .uploadId(uploadId)
+                    .multipartUpload(CompletedMultipartUpload.builder().parts(completedParts).build())
+                    .build());
+        } catch (IOException | RuntimeException e) {
+            abort();
+            throw e;
+        }
+    }
+
+    /**
+     * Descarta o upload em andamento, se houver. Pode ser chamado mais de uma vez.
+     */
+    void abort() {
+        finished = true;
+        releaseBuffer();
+        if (uploadId == null) {
+            return;
+        }
+        parts.forEach(Part::cancel);
+        s3Client.abortMultipartUpload(AbortMultipartUploadRequest.builder()
+                .bucket(bucketName)
+                .key(key)
+                .uploadId(uploadId)
+                .build());
+        uploadId = null;
+    }
+
+    private void uploadBufferedPart() throws IOException {
+        if (uploadId == null) {
+            uploadId = s3Client.createMultipartUpload(CreateMultipartUploadRequest.builder()
+                    .bucket(bucketName)
+                    .key(key)
+                    .build()).uploadId();
+        }
+
+        int partNumber = parts.size() + 1;
+        byte[] content = buffer;
+        int length = position;
+        String currentUploadId = uploadId;
+        // A permissão do buffer passa para a parte e é devolvida quando o envio termina
+        Part part = new Part(bufferPermits);
+        buffer = null;
+        position = 0;
+        try {
+            part.future = partExecutor.submit(() -> {
+                try {
+                    UploadPartRequest uploadPartRequest = UploadPartRequest.builder()
+                            .bucket(bucketName)
+                            .key(key)
+                            .uploadId(currentUploadId)
+                            .partNumber(partNumber)
+                            .build();
+                    String eTag = s3Client.uploadPart(uploadPartRequest, RequestBody.fromInputStream(new ByteArrayInputStream(content, 0, length), length)).eTag();
+                    return CompletedPart.builder().partNumber(partNumber).eTag(eTag).build();
+                } finally {
+                    part.release();
+                }
+            });
+        } catch (RuntimeException e) {
+            part.release();
+            throw e;
+        }
+        parts.add(part);
+    }
+
+    private CompletedPart awaitPart(int index) throws IOException {
+        try {
+            return parts.get(index).future.get();
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            throw new InterruptedIOException("Upload interrompido");
+        } catch (ExecutionException e) {
+            throw new IOException("Falha no upload de uma das partes do arquivo", e.getCause());
+        }
+    }
+
+    private void ensureBuffer() throws IOException {
+        if (buffer != null) {
+            return;
+        }
+        try {
+            bufferPermits.acquire();
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            throw new InterruptedIOException("Upload interrompido");
+        }
+        buffer = new byte[partSize];
+        position = 0;
+    }
+
+    private void releaseBuffer() {
+        if (buffer != null) {
+            buffer = null;
+            position = 0;
+            bufferPermits.release();
+        }
+    }
+
+    private void ensureOpen() throws IOException {
+        if (finished) {
+            throw new IOException("Upload já foi concluído ou abortado");
+        }
+    }
+
+    /**
+     * Parte submetida para envio. A permissão é devolvida uma única vez, seja ao fim do envio
+     * ou no cancelamento de uma parte que nunca chegou a executar.
+     */
+    private static final class Part {
+        private final Semaphore bufferPermits;
+        private final AtomicBoolean released = new AtomicBoolean();
+        private Future<CompletedPart> future;
+
+        private Part(Semaphore bufferPermits) {
+            this.bufferPermits = bufferPermits;
+        }
+
+        private void cancel() {
+            future.cancel(true);
+            release();
+        }
+
+        private void release() {
+            if (released.compareAndSet(false, true)) {
+                bufferPermits.release();
+            }
+        }
+    }
+}
@@ -1,16 +1,38 @@
 package com.fiapx.processor.application.service;
 
+import jakarta.annotation.PreDestroy;
 import org.springframework.stereotype.Service;
-import software.amazon.awssdk.core.sync.RequestBody;
 import software.amazon.awssdk.services.s3.S3Client;
-import software.amazon.awssdk.services.s3.model.PutObjectRequest;
 
-import java.io.File;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.io.UncheckedIOException;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Semaphore;
 
 @Service
 public class S3UploaderService {
 
+    // Conteúdos acima deste tamanho são enviados via multipart com partes em paralelo
+    private static final int PART_SIZE = 8 * 1024 * 1024;
+    private static final int MAX_CONCURRENCY = 8;
+    private static final int MAX_CONCURRENT_UPLOADS = 4;
+
     private final S3Client s3Client;
+    private final ExecutorService partExecutor = Executors.newFixedThreadPool(MAX_CONCURRENCY);
+    private final ExecutorService uploadExecutor = Executors.newFixedThreadPool(MAX_CONCURRENT_UPLOADS);
+    // Limite global de partes em memória (PART_SIZE cada), compartilhado por todos os uploads
+    private final Semaphore bufferPermits = new Semaphore(MAX_CONCURRENCY, true);
+
+    /**
+     * Produz o conteúdo a ser enviado, escrevendo-o no stream de upload.
+     */
+    @FunctionalInterface
+    public interface StreamWriter {
+        void writeTo(OutputStream outputStream) throws IOException;
+    }
 
     // S3Client é injetado automaticamente pelo Spring Cloud AWS
     public S3UploaderService(S3Client s3Client) {
@@ -18,18 +40,43 @@ public class S3UploaderService {
     }
 
     /**
-     * Faz o upload de um arquivo para um bucket S3.
+     * Envia para o S3 o conteúdo produzido pelo writer, sem gravar arquivo intermediário em disco.
      *
      * @param bucketName O nome do bucket.
      * @param key O nome do objeto (caminho do arquivo no bucket).
-     * @param filePath O caminho local do arquivo a ser enviado.
+     * @param writer Quem escreve o conteúdo no stream de upload.
      */
-    public void uploadFile(String bucketName, String key, String filePath) {
-        PutObjectRequest objectRequest = PutObjectRequest.builder()
-                .bucket(bucketName)
-                .key(key)
-                .build();
+    public void uploadStream(String bucketName, String key, StreamWriter writer) {
+        S3MultipartOutputStream outputStream = new S3MultipartOutputStream(
+                s3Client, partExecutor, bucketName, key, PART_SIZE, bufferPermits);
+        try {
+            writer.writeTo(outputStream);
+            outputStream.complete();
+        } catch (IOException e) {
+            outputStream.abort();
+            throw new UncheckedIOException("Falha no upload para o S3: " + key, e);
+        } catch (RuntimeException e) {
+            outputStream.abort();
+            throw e;
+        }
+    }
+
+    /**
+     * Faz o upload em segundo plano, liberando a thread chamadora
+     * para seguir com o próximo processamento.
+     *
+     * @param bucketName O nome do bucket.
+     * @param key O nome do objeto (caminho do arquivo no bucket).
+     * @param writer Quem escreve o conteúdo no stream de upload.
+     * @return Um future concluído quando o upload terminar.
+     */
+    public CompletableFuture<Void> uploadStreamAsync(String bucketName, String key, StreamWriter writer) {
+        return CompletableFuture.runAsync(() -> uploadStream(bucketName, key, writer), uploadExecutor);
+    }
 
-        s3Client.putObject(objectRequest, RequestBody.fromFile(new File(filePath)));
+    @PreDestroy
+    void shutdown() {
+        // Uploads em andamento dependem do pool de partes: drena-os primeiro
+        ExecutorShutdown.drain(uploadExecutor, partExecutor);
     }
 }
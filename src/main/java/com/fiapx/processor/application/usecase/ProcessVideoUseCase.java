@@ -7,10 +7,13 @@ import com.fiapx.processor.domain.service.VideoProcessingPort;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.beans.factory.annotation.Value;
+import org.springframework.core.task.TaskExecutor;
 import org.springframework.stereotype.Service;
 
 import java.io.File;
 import java.util.UUID;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.CompletionException;
 
 @Service
 @RequiredArgsConstructor
@@ -22,15 +25,26 @@ public class ProcessVideoUseCase {
     private final com.fiapx.processor.domain.service.NotificationPort notification;
     private final S3UploaderService s3Uploader;
     private final S3DownloaderService s3Downloader;
+    private final TaskExecutor statusExecutor;
 
     @Value("${s3.bucket.name}")
     private String s3BucketName;
 
-    public void execute(UUID videoId, String storagePath, String userEmail, String contentType) {
+    /**
+     * Extrai os frames do vídeo e dispara em segundo plano a geração e o upload do ZIP,
+     * permitindo que o consumidor siga para a próxima mensagem.
+     *
+     * @return Um future concluído após o upload e a atualização final de status.
+     */
+    public CompletableFuture<Void> execute(UUID videoId, String storagePath, String userEmail, String contentType) {
         File downloadedVideo = null;
+        CompletableFuture<Void> processingStatus = null;
+        // Após entregar o upload ao pool, a limpeza dos frames passa a ser feita pelo future
+        boolean uploadHandedOff = false;
         try {
             log.info("Iniciando processamento do vídeo: {} | Tipo: {} | Usuário: {}", videoId, contentType, userEmail);
-            videoApi.updateStatus(videoId, "PROCESSING", null);
+            // O status PROCESSING é enviado em paralelo ao download; não precisa bloquear o início do S3
+            processingStatus = CompletableFuture.runAsync(() -> videoApi.updateStatus(videoId, "PROCESSING", null), statusExecutor);
 
             // 0. Fazer download do vídeo do S3
             String s3Key = storagePath.substring(storagePath.lastIndexOf("uploads/"));
@@ -43,34 +57,62 @@ public class ProcessVideoUseCase {
             // 1. Extrair imagens (FFmpeg) usando o arquivo baixado
             File imagesDir = videoProcessing.extractImages(videoId, downloadedVideo.getAbsolutePath());
 
-            // 2. Criar ZIP
-            File zipFile = videoProcessing.createZip(videoId, imagesDir);
-
-            // 3. Fazer upload do ZIP para o S3
+            // 2. Criar o ZIP e enviá-lo ao S3 em segundo plano, direto da memória
             String zipS3Key = "processed/" + videoId.toString() + ".zip";
-            s3Uploader.uploadFile(s3BucketName, zipS3Key, zipFile.getAbsolutePath());
             String s3Url = String.format("https://%s.s3.amazonaws.com/%s", s3BucketName, zipS3Key);
 
-            // 4. Notificar conclusão com a URL do S3
-            videoApi.updateStatus(videoId, "COMPLETED", s3Url);
-            log.info("Processamento concluído para o vídeo: {}. Arquivo disponível em: {}", videoId, s3Url);
+            CompletableFuture<Void> result = s3Uploader.uploadStreamAsync(s3BucketName, zipS3Key,
+                            outputStream -> videoProcessing.writeZip(videoId, imagesDir, outputStream))
+                    // Garante que PROCESSING foi registrado antes de COMPLETED
+                    .thenCombine(processingStatus, (upload, status) -> status)
+                    .thenRun(() -> {
+                        // 3. Notificar conclusão com a URL do S3
+                        videoApi.updateStatus(videoId, "COMPLETED", s3Url);
+                        log.info("Processamento concluído para o vídeo: {}. Arquivo disponível em: {}", videoId, s3Url);
+                    })
+                    .exceptionally(e -> {
+                        handleError(videoId, userEmail, e instanceof CompletionException && e.getCause() != null ? e.getCause() : e);
+                        return null;
+                    })
+                    .whenComplete((ignored, e) -> videoProcessing.cleanup(videoId));
+            uploadHandedOff = true;
+            return result;
 
         } catch (Exception e) {
-            log.error("Erro ao processar vídeo: {}", videoId, e);
-            videoApi.updateStatus(videoId, "ERROR", null);
-            if (userEmail != null && !userEmail.isBlank()) {
-                notification.sendErrorNotification(userEmail, videoId, e.getMessage());
-            }
+            awaitQuietly(processingStatus);
+            handleError(videoId, userEmail, e);
+            return CompletableFuture.completedFuture(null);
         } finally {
+            if (!uploadHandedOff) {
+                videoProcessing.cleanup(videoId);
+            }
             // Limpa o arquivo de vídeo baixado
             if (downloadedVideo != null) {
-                boolean deleted = downloadedVideo.delete();
-                if (deleted) {
-                    log.debug("Arquivo temporário removido com sucesso: {}", downloadedVideo.getAbsolutePath());
-                } else {
-                    log.warn("Falha ao remover arquivo temporário: {}", downloadedVideo.getAbsolutePath());
-                }
+                deleteTemporaryFile(downloadedVideo);
             }
         }
     }
+
+    private void handleError(UUID videoId, String userEmail, Throwable e) {
+        log.error("Erro ao processar vídeo: {}", videoId, e);
+        videoApi.updateStatus(videoId, "ERROR", null);
+        if (userEmail != null && !userEmail.isBlank()) {
+            notification.sendErrorNotification(userEmail, videoId, e.getMessage());
+        }
+    }
+
+    private void awaitQuietly(CompletableFuture<Void> future) {
+        if (future != null) {
+            future.exceptionally(e -> null).join();
+        }
+    }
+
+    private void deleteTemporaryFile(File file) {
+        boolean deleted = file.delete();
+        if (deleted) {
+            log.debug("Arquivo temporário removido com sucesso: {}", file.getAbsolutePath());
+        } else {
+            log.warn("Falha ao remover arquivo temporário: {}", file.getAbsolutePath());
+        }
+    }
 }
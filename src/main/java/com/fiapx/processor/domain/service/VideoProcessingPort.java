@@ -1,9 +1,11 @@
 package com.fiapx.processor.domain.service;
 
 import java.io.File;
+import java.io.OutputStream;
 import java.util.UUID;
 
 public interface VideoProcessingPort {
     File extractImages(UUID videoId, String storagePath);
-    File createZip(UUID videoId, File imagesDir);
+    void writeZip(UUID videoId, File imagesDir, OutputStream outputStream);
+    void cleanup(UUID videoId);
 }
@@ -3,9 +3,12 @@ package com.fiapx.processor.infrastructure.adapter.external;
 import com.fiapx.processor.domain.service.VideoApiPort;
 import lombok.RequiredArgsConstructor;
 import org.springframework.beans.factory.annotation.Value;
+import org.springframework.http.client.JdkClientHttpRequestFactory;
 import org.springframework.stereotype.Component;
 import org.springframework.web.client.RestTemplate;
 
+import java.net.http.HttpClient;
+import java.time.Duration;
 import java.util.HashMap;
 import java.util.Map;
 import java.util.UUID;
@@ -14,7 +17,8 @@ import java.util.UUID;
 @RequiredArgsConstructor
 public class VideoApiAdapter implements VideoApiPort {
 
-    private final RestTemplate restTemplate = new RestTemplate();
+    // HttpClient mantém um pool de conexões keep-alive reutilizado entre as atualizações de status
+    private final RestTemplate restTemplate = createRestTemplate();
 
     @Value("${video.api.url:http://video-api:8082/api/videos}")
     private String videoApiUrl;
@@ -25,7 +29,19 @@ public class VideoApiAdapter implements VideoApiPort {
         Map<String, String> body = new HashMap<>();
         body.put("status", status);
         body.put("storagePath", storagePath);
-        
-        restTemplate.postForObject(url, body, Object.class);
+
+        // A resposta não é usada: Void.class evita desserializar o vídeo devolvido pela API
+        restTemplate.postForEntity(url, body, Void.class);
+    }
+
+    private static RestTemplate createRestTemplate() {
+        HttpClient httpClient = HttpClient.newBuilder()
+                .version(HttpClient.Version.HTTP_1_1)
+                .connectTimeout(Duration.ofSeconds(5))
+                .build();
+
+        JdkClientHttpRequestFactory requestFactory = new JdkClientHttpRequestFactory(httpClient);
+        requestFactory.setReadTimeout(Duration.ofSeconds(30));
+        return new RestTemplate(requestFactory);
     }
 }
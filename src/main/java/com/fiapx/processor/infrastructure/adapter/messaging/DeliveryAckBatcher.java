@@ -0,0 +1,131 @@
+package com.fiapx.processor.infrastructure.adapter.messaging;
+
+import com.fiapx.processor.infrastructure.config.WorkerProperties;
+import com.rabbitmq.client.Channel;
+import jakarta.annotation.PostConstruct;
+import jakarta.annotation.PreDestroy;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.stereotype.Component;
+
+import java.io.IOException;
+import java.util.Map;
+import java.util.NavigableSet;
+import java.util.TreeSet;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.Executors;
+import java.util.concurrent.ScheduledExecutorService;
+import java.util.concurrent.TimeUnit;
+
+/**
+ * Agrupa as confirmações (ack) de cada canal em um único basicAck com multiple=true.
+ * Só confirma tags concluídas e menores que a menor entrega ainda em processamento:
+ * tags rejeitadas já não pertencem ao broker e confirmá-las fecharia o canal.
+ */
+@Component
+@Slf4j
+public class DeliveryAckBatcher {
+
+    private static final long FLUSH_INTERVAL_MS = 100;
+
+    private final Map<Channel, ChannelAcks> acksByChannel = new ConcurrentHashMap<>();
+    private final int batchSize;
+    private ScheduledExecutorService flusher;
+
+    public DeliveryAckBatcher(WorkerProperties workerProperties) {
+        // O broker para de entregar ao atingir o prefetch sem acks; o lote fecha na metade dessa janela
+        this.batchSize = Math.max(1, workerProperties.rabbitmq().prefetch() / 2);
+    }
+
+    @PostConstruct
+    void start() {
+        flusher = Executors.newSingleThreadScheduledExecutor(runnable -> new Thread(runnable, "ack-flusher"));
+        flusher.scheduleAtFixedRate(this::flushAll, FLUSH_INTERVAL_MS, FLUSH_INTERVAL_MS, TimeUnit.MILLISECONDS);
+    }
+
+    /**
+     * Registra uma entrega recebida. Deve ser chamado na thread do consumidor, na ordem de chegada.
+     */
+    public void register(Channel channel, long deliveryTag) {
+        ChannelAcks acks = acksByChannel.computeIfAbsent(channel, c -> new ChannelAcks());
+        synchronized (acks) {
+            acks.inFlight.add(deliveryTag);
+        }
+    }
+
+    /**
+     * Marca a entrega como concluída; a confirmação é enviada no próximo lote.
+     */
+    public void complete(Channel channel, long deliveryTag) {
+        ChannelAcks acks = acksByChannel.get(channel);
+        if (acks == null) {
+            return;
+        }
+        synchronized (acks) {
+            acks.inFlight.remove(deliveryTag);
+            acks.completed.add(deliveryTag);
+            if (acks.completed.size() >= batchSize) {
+                flush(channel, acks);
+            }
+        }
+    }
+
+    /**
+     * Rejeita a entrega imediatamente, devolvendo-a para a fila.
+     */
+    public void reject(Channel channel, long deliveryTag) {
+        ChannelAcks acks = acksByChannel.get(channel);
+        if (acks != null) {
+            synchronized (acks) {
+                acks.inFlight.remove(deliveryTag);
+            }
+        }
+        try {
+            channel.basicNack(deliveryTag, false, true);
+        } catch (IOException | RuntimeException e) {
+            // Canal fechado no meio do caminho (failover do broker): a entrega será reenviada
+            log.error("Falha ao rejeitar a mensagem: {}", deliveryTag, e);
+        }
+    }
+
+    void flushAll() {
+        acksByChannel.forEach((channel, acks) -> {
+            if (!channel.isOpen()) {
+                // Entregas de um canal fechado são reenviadas pelo broker; não há o que confirmar
+                acksByChannel.remove(channel);
+                return;
+            }
+            synchronized (acks) {
+                flush(channel, acks);
+            }
+        });
+    }
+
+    private void flush(Channel channel, ChannelAcks acks) {
+        Long ackUpTo = acks.inFlight.isEmpty()
+                ? (acks.completed.isEmpty() ? null : acks.completed.last())
+                : acks.completed.lower(acks.inFlight.first());
+        if (ackUpTo == null) {
+            return;
+        }
+        try {
+            channel.basicAck(ackUpTo, true);
+            acks.completed.headSet(ackUpTo, true).clear();
+        } catch (IOException | RuntimeException e) {
+            // Uma exceção não tratada aqui cancelaria as execuções seguintes do flush periódico
+            log.error("Falha ao confirmar as mensagens até a tag: {}", ackUpTo, e);
+        }
+    }
+
+    @PreDestroy
+    void shutdown() {
+        if (flusher != null) {
+            flusher.shutdown();
+        }
+        flushAll();
+    }
+
+    private static final class ChannelAcks {
+        private final NavigableSet<Long> inFlight = new TreeSet<>();
+        private final NavigableSet<Long> completed = new TreeSet<>();
+    }
+}
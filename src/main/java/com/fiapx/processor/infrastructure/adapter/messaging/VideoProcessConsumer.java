@@ -1,13 +1,17 @@
 package com.fiapx.processor.infrastructure.adapter.messaging;
 
 import com.fiapx.processor.application.usecase.ProcessVideoUseCase;
+import com.rabbitmq.client.Channel;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.amqp.rabbit.annotation.RabbitListener;
+import org.springframework.amqp.support.AmqpHeaders;
+import org.springframework.messaging.handler.annotation.Header;
 import org.springframework.stereotype.Component;
 
 import java.util.Map;
 import java.util.UUID;
+import java.util.concurrent.CompletableFuture;
 
 @Component
 @RequiredArgsConstructor
@@ -15,28 +19,60 @@ import java.util.UUID;
 public class VideoProcessConsumer {
 
     private final ProcessVideoUseCase processVideoUseCase;
+    private final DeliveryAckBatcher ackBatcher;
 
     @RabbitListener(queues = "video-process-queue")
-    public void consume(Map<String, Object> message) {
-        log.info("Mensagem recebida da fila: {}", message);
-
-        String idStr = (String) message.get("id");
-        if (idStr == null) {
-            log.error("ID não encontrado na mensagem: {}", message);
-            return;
-        }
+    public void consume(Map<String, Object> message, Channel channel, @Header(AmqpHeaders.DELIVERY_TAG) long deliveryTag) {
+        // O conteúdo completo só é formatado com DEBUG habilitado
+        log.info("Mensagem recebida da fila para o vídeo: {}", message.get("id"));
+        log.debug("Conteúdo da mensagem: {}", message);
+        ackBatcher.register(channel, deliveryTag);
 
         UUID videoId;
+        String storagePath;
+        String userEmail;
+        String contentType;
         try {
+            String idStr = stringField(message, "id");
+            if (idStr == null) {
+                log.error("ID não encontrado na mensagem: {}", message);
+                ackBatcher.complete(channel, deliveryTag);
+                return;
+            }
             videoId = UUID.fromString(idStr);
+            storagePath = stringField(message, "storagePath");
+            userEmail = stringField(message, "userEmail");
+            contentType = stringField(message, "contentType");
         } catch (IllegalArgumentException e) {
-            log.error("UUID inválido na mensagem: {}", idStr, e);
+            // A tag já foi registrada: mensagens inválidas precisam ser confirmadas para não travar o canal
+            log.error("Mensagem inválida descartada: {}", message, e);
+            ackBatcher.complete(channel, deliveryTag);
             return;
         }
-        String storagePath = (String) message.get("storagePath");
-        String userEmail = (String) message.get("userEmail");
-        String contentType = (String) message.get("contentType");
 
-        processVideoUseCase.execute(videoId, storagePath, userEmail, contentType);
+        CompletableFuture<Void> processing;
+        try {
+            processing = processVideoUseCase.execute(videoId, storagePath, userEmail, contentType);
+        } catch (RuntimeException e) {
+            processing = CompletableFuture.failedFuture(e);
+        }
+
+        // A confirmação só ocorre quando o upload em segundo plano termina
+        processing.whenComplete((ignored, e) -> {
+            if (e == null) {
+                ackBatcher.complete(channel, deliveryTag);
+            } else {
+                log.error("Falha inesperada ao processar o vídeo: {}", videoId, e);
+                ackBatcher.reject(channel, deliveryTag);
+            }
+        });
+    }
+
+    private String stringField(Map<String, Object> message, String field) {
+        Object value = message.get(field);
+        if (value != null && !(value instanceof String)) {
+            throw new IllegalArgumentException("Campo '" + field + "' deveria ser texto: " + value.getClass().getSimpleName());
+        }
+        return (String) value;
     }
 }
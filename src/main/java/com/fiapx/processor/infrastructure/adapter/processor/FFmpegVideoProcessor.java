@@ -6,7 +6,13 @@ import org.springframework.stereotype.Component;
 
 import java.io.*;
 import java.nio.file.Files;
+import java.nio.file.NoSuchFileException;
+import java.nio.file.Path;
+import java.nio.file.Paths;
+import java.util.Comparator;
 import java.util.UUID;
+import java.util.stream.Stream;
+import java.util.zip.CRC32;
 import java.util.zip.ZipEntry;
 import java.util.zip.ZipOutputStream;
 
@@ -14,14 +20,14 @@ import java.util.zip.ZipOutputStream;
 @Slf4j
 public class FFmpegVideoProcessor implements VideoProcessingPort {
 
+    private static final String WORK_DIR = "/tmp/videos/";
+
     @Override
     public File extractImages(UUID videoId, String storagePath) {
-        log.info("Iniciando extração real de imagens para o vídeo: {}", videoId);
+        log.debug("Iniciando extração real de imagens para o vídeo: {}", videoId);
         
-        File outputDir = new File("/tmp/videos/" + videoId + "/images");
-        if (!outputDir.exists()) {
-            outputDir.mkdirs();
-        }
+        File outputDir = new File(WORK_DIR + videoId + "/images");
+        outputDir.mkdirs();
 
         // Comando FFmpeg: extrair 1 frame por segundo (-vf fps=1)
         ProcessBuilder processBuilder = new ProcessBuilder(
@@ -46,7 +52,7 @@ public class FFmpegVideoProcessor implements VideoProcessingPort {
             if (exitCode != 0) {
                 log.error("FFmpeg falhou com código de saída: {}", exitCode);
             } else {
-                log.info("Extração de imagens concluída com sucesso para o vídeo: {}", videoId);
+                log.debug("Extração de imagens concluída com sucesso para o vídeo: {}", videoId);
             }
         } catch (IOException | InterruptedException e) {
             log.error("Erro ao executar FFmpeg", e);
@@ -57,16 +63,11 @@ public class FFmpegVideoProcessor implements VideoProcessingPort {
     }
 
     @Override
-    public File createZip(UUID videoId, File imagesDir) {
-        log.info("Iniciando criação real de ZIP para o vídeo: {}", videoId);
-        File zipFile = new File("/tmp/videos/" + videoId + "/images.zip");
-        
-        // Garante que o diretório pai exista
-        zipFile.getParentFile().mkdirs();
+    public void writeZip(UUID videoId, File imagesDir, OutputStream outputStream) {
+        log.debug("Iniciando criação real de ZIP para o vídeo: {}", videoId);
 
-        try (FileOutputStream fos = new FileOutputStream(zipFile);
-             ZipOutputStream zos = new ZipOutputStream(fos)) {
-            
+        // O ZIP é escrito direto no destino (upload para o S3), sem arquivo intermediário em disco
+        try (ZipOutputStream zos = new ZipOutputStream(outputStream)) {
             File[] files = imagesDir.listFiles();
             if (files != null) {
                 for (File file : files) {
@@ -75,25 +76,38 @@ public class FFmpegVideoProcessor implements VideoProcessingPort {
                     }
                 }
             }
-            log.info("Criação do ZIP concluída com sucesso: {}", zipFile.getAbsolutePath());
         } catch (IOException e) {
-            log.error("Erro ao criar arquivo ZIP", e);
+            throw new UncheckedIOException("Erro ao criar arquivo ZIP para o vídeo: " + videoId, e);
         }
-        
-        return zipFile;
+        log.debug("Criação do ZIP concluída com sucesso para o vídeo: {}", videoId);
     }
 
-    private void addToZip(File file, ZipOutputStream zos) throws IOException {
-        try (FileInputStream fis = new FileInputStream(file)) {
-            ZipEntry zipEntry = new ZipEntry(file.getName());
-            zos.putNextEntry(zipEntry);
-            
-            byte[] bytes = new byte[1024];
-            int length;
-            while ((length = fis.read(bytes)) >= 0) {
-                zos.write(bytes, 0, length);
-            }
-            zos.closeEntry();
+    @Override
+    public void cleanup(UUID videoId) {
+        Path videoDir = Paths.get(WORK_DIR + videoId);
+        try (Stream<Path> paths = Files.walk(videoDir)) {
+            paths.sorted(Comparator.reverseOrder()).forEach(path -> path.toFile().delete());
+        } catch (NoSuchFileException e) {
+            log.debug("Nenhum arquivo temporário para remover: {}", videoDir);
+        } catch (IOException | UncheckedIOException e) {
+            log.warn("Falha ao remover diretório temporário: {}", videoDir, e);
         }
     }
+
+    private void addToZip(File file, ZipOutputStream zos) throws IOException {
+        byte[] bytes = Files.readAllBytes(file.toPath());
+        CRC32 crc = new CRC32();
+        crc.update(bytes);
+
+        // Frames JPEG já são comprimidos: STORED evita gastar CPU recomprimindo
+        ZipEntry zipEntry = new ZipEntry(file.getName());
+        zipEntry.setMethod(ZipEntry.STORED);
+        zipEntry.setSize(bytes.length);
+        zipEntry.setCompressedSize(bytes.length);
+        zipEntry.setCrc(crc.getValue());
+
+        zos.putNextEntry(zipEntry);
+        zos.write(bytes);
+        zos.closeEntry();
+    }
 }
@@ -1,18 +1,31 @@
 package com.fiapx.processor.infrastructure.config;
 
+import org.springframework.boot.context.properties.EnableConfigurationProperties;
 import org.springframework.context.annotation.Bean;
 import org.springframework.context.annotation.Configuration;
+import software.amazon.awssdk.core.client.config.ClientOverrideConfiguration;
+import software.amazon.awssdk.core.retry.RetryMode;
+import software.amazon.awssdk.http.apache.ApacheHttpClient;
 import software.amazon.awssdk.regions.Region;
 import software.amazon.awssdk.services.s3.S3Client;
 import software.amazon.awssdk.services.ses.SesClient;
 
 @Configuration
+@EnableConfigurationProperties(WorkerProperties.class)
 public class AwsConfig {
 
+    // Os pools fixos de transferência usam até 20 conexões (8 faixas de download, 8 partes, 4 uploads), mais uma
+    // por consumidor (worker.rabbitmq.max-concurrency, padrão 10). S3_POOL precisa crescer junto com max-concurrency
     @Bean
-    public S3Client s3Client() {
+    public S3Client s3Client(WorkerProperties workerProperties) {
         return S3Client.builder()
                 .region(Region.US_EAST_1)
+                .httpClientBuilder(ApacheHttpClient.builder()
+                        .maxConnections(workerProperties.s3().maxConnections())
+                        .tcpKeepAlive(true))
+                .overrideConfiguration(ClientOverrideConfiguration.builder()
+                        .retryPolicy(RetryMode.ADAPTIVE)
+                        .build())
                 .build();
     }
 
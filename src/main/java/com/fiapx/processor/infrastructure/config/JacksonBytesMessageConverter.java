@@ -0,0 +1,49 @@
+package com.fiapx.processor.infrastructure.config;
+
+import com.fasterxml.jackson.databind.JavaType;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import org.springframework.amqp.core.Message;
+import org.springframework.amqp.core.MessageProperties;
+import org.springframework.amqp.support.converter.MessageConversionException;
+import org.springframework.amqp.support.converter.MessageConverter;
+
+import java.io.IOException;
+import java.lang.reflect.Type;
+
+/**
+ * Conversor que entrega o corpo bruto (byte[]) da mensagem ao ObjectMapper.
+ * O Jackson2JsonMessageConverter decodifica o corpo para String antes de ler, o que
+ * custa uma cópia no JSON e corrompe formatos binários como MessagePack.
+ */
+class JacksonBytesMessageConverter implements MessageConverter {
+
+    private final ObjectMapper objectMapper;
+    private final String contentType;
+
+    JacksonBytesMessageConverter(ObjectMapper objectMapper, String contentType) {
+        this.objectMapper = objectMapper;
+        this.contentType = contentType;
+    }
+
+    @Override
+    public Message toMessage(Object object, MessageProperties messageProperties) {
+        try {
+            messageProperties.setContentType(contentType);
+            return new Message(objectMapper.writeValueAsBytes(object), messageProperties);
+        } catch (IOException e) {
+            throw new MessageConversionException("Falha ao serializar a mensagem como " + contentType, e);
+        }
+    }
+
+    @Override
+    public Object fromMessage(Message message) {
+        // Tipo do parâmetro do @RabbitListener, informado pelo container
+        Type inferredType = message.getMessageProperties().getInferredArgumentType();
+        JavaType targetType = objectMapper.constructType(inferredType != null ? inferredType : Object.class);
+        try {
+            return objectMapper.readValue(message.getBody(), targetType);
+        } catch (IOException e) {
+            throw new MessageConversionException("Falha ao ler a mensagem como " + contentType, e);
+        }
+    }
+}
@@ -1,24 +1,45 @@
 package com.fiapx.processor.infrastructure.config;
 
-import org.springframework.amqp.support.converter.Jackson2JsonMessageConverter;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import org.msgpack.jackson.dataformat.MessagePackFactory;
+import org.springframework.amqp.core.AcknowledgeMode;
+import org.springframework.amqp.core.MessageProperties;
+import org.springframework.amqp.support.converter.ContentTypeDelegatingMessageConverter;
+import org.springframework.boot.context.properties.EnableConfigurationProperties;
 import org.springframework.context.annotation.Bean;
 import org.springframework.context.annotation.Configuration;
 
 @Configuration
+@EnableConfigurationProperties(WorkerProperties.class)
 public class RabbitMqConfig {
 
+    public static final String MSGPACK_CONTENT_TYPE = "application/msgpack";
+
     @Bean
-    public org.springframework.amqp.rabbit.config.SimpleRabbitListenerContainerFactory rabbitListenerContainerFactory(org.springframework.amqp.rabbit.connection.ConnectionFactory connectionFactory) {
+    public org.springframework.amqp.rabbit.config.SimpleRabbitListenerContainerFactory rabbitListenerContainerFactory(org.springframework.amqp.rabbit.connection.ConnectionFactory connectionFactory, WorkerProperties workerProperties) {
         org.springframework.amqp.rabbit.config.SimpleRabbitListenerContainerFactory factory = new org.springframework.amqp.rabbit.config.SimpleRabbitListenerContainerFactory();
         factory.setConnectionFactory(connectionFactory);
-        factory.setMessageConverter(new Jackson2JsonMessageConverter());
-        factory.setConcurrentConsumers(5);
-        factory.setMaxConcurrentConsumers(10);
+        // Reutiliza o mesmo conversor (e ObjectMapper) em todos os consumidores
+        factory.setMessageConverter(messageConverter());
+        // Cada consumidor usa um canal próprio sobre a mesma conexão TCP, com prefetch independente
+        factory.setConcurrentConsumers(workerProperties.rabbitmq().concurrency());
+        factory.setMaxConcurrentConsumers(workerProperties.rabbitmq().maxConcurrency());
+        // Sem este ajuste o Spring AMQP pré-carrega 250 mensagens, retendo a fila inteira num único pod
+        factory.setPrefetchCount(workerProperties.rabbitmq().prefetch());
+        // O consumidor confirma a mensagem apenas após o upload assíncrono do ZIP
+        factory.setAcknowledgeMode(AcknowledgeMode.MANUAL);
         return factory;
     }
 
     @Bean
-    public Jackson2JsonMessageConverter messageConverter() {
-        return new Jackson2JsonMessageConverter();
+    public ContentTypeDelegatingMessageConverter messageConverter() {
+        // JSON continua sendo o padrão; produtores podem migrar para MessagePack pelo content_type
+        // Ambos os formatos são lidos direto do byte[] da entrega, sem decodificação intermediária para String
+        ContentTypeDelegatingMessageConverter converter = new ContentTypeDelegatingMessageConverter(
+                new JacksonBytesMessageConverter(new ObjectMapper(), MessageProperties.CONTENT_TYPE_JSON));
+
+        converter.addDelegate(MSGPACK_CONTENT_TYPE,
+                new JacksonBytesMessageConverter(new ObjectMapper(new MessagePackFactory()), MSGPACK_CONTENT_TYPE));
+        return converter;
     }
 }
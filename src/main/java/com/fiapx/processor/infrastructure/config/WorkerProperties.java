@@ -0,0 +1,28 @@
+package com.fiapx.processor.infrastructure.config;
+
+import org.springframework.boot.context.properties.ConfigurationProperties;
+import org.springframework.boot.context.properties.bind.DefaultValue;
+
+/**
+ * Parâmetros de ajuste do worker, lidos uma única vez na inicialização.
+ * Os nomes das variáveis de ambiente são mapeados no application.yml.
+ */
+@ConfigurationProperties(prefix = "worker")
+public record WorkerProperties(@DefaultValue RabbitMq rabbitmq, @DefaultValue S3 s3) {
+
+    /**
+     * @param prefetch Mensagens pré-carregadas por consumidor.
+     * @param concurrency Consumidores iniciais, cada um com seu próprio canal na mesma conexão.
+     * @param maxConcurrency Limite de consumidores quando a fila acumula mensagens.
+     */
+    public record RabbitMq(@DefaultValue("10") int prefetch,
+                           @DefaultValue("5") int concurrency,
+                           @DefaultValue("10") int maxConcurrency) {
+    }
+
+    /**
+     * @param maxConnections Tamanho do pool de conexões HTTP do S3Client.
+     */
+    public record S3(@DefaultValue("50") int maxConnections) {
+    }
+}
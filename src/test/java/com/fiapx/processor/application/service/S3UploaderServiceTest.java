@@ -6,16 +6,31 @@ import org.mockito.ArgumentCaptor;
 import org.mockito.InjectMocks;
 import org.mockito.Mock;
 import org.mockito.junit.jupiter.MockitoExtension;
+import org.springframework.test.util.ReflectionTestUtils;
 import software.amazon.awssdk.core.sync.RequestBody;
 import software.amazon.awssdk.services.s3.S3Client;
+import software.amazon.awssdk.services.s3.model.AbortMultipartUploadRequest;
+import software.amazon.awssdk.services.s3.model.CompleteMultipartUploadRequest;
+import software.amazon.awssdk.services.s3.model.CreateMultipartUploadRequest;
+import software.amazon.awssdk.services.s3.model.CreateMultipartUploadResponse;
 import software.amazon.awssdk.services.s3.model.PutObjectRequest;
+import software.amazon.awssdk.services.s3.model.UploadPartRequest;
+import software.amazon.awssdk.services.s3.model.UploadPartResponse;
 
 import java.io.IOException;
-import java.nio.file.Files;
-import java.nio.file.Path;
+import java.io.InterruptedIOException;
+import java.io.UncheckedIOException;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.Semaphore;
 
 import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+import static org.mockito.ArgumentMatchers.any;
+import static org.mockito.Mockito.never;
+import static org.mockito.Mockito.times;
 import static org.mockito.Mockito.verify;
+import static org.mockito.Mockito.when;
 
 @ExtendWith(MockitoExtension.class)
 class S3UploaderServiceTest {
@@ -27,19 +42,16 @@ class S3UploaderServiceTest {
     private S3UploaderService s3UploaderService;
 
     @Test
-    void shouldUploadFileSuccessfully() throws IOException {
+    void shouldUploadSmallStreamWithSinglePutObject() {
         // Given
         String bucketName = "test-bucket";
         String key = "test-key";
-        // Create a temporary file to upload
-        Path tempFile = Files.createTempFile("test-upload", ".txt");
-        Files.writeString(tempFile, "Hello, S3!");
 
         ArgumentCaptor<PutObjectRequest> putObjectRequestCaptor = ArgumentCaptor.forClass(PutObjectRequest.class);
         ArgumentCaptor<RequestBody> requestBodyCaptor = ArgumentCaptor.forClass(RequestBody.class);
 
         // When
-        s3UploaderService.uploadFile(bucketName, key, tempFile.toString());
+        s3UploaderService.uploadStream(bucketName, key, out -> out.write("Hello, S3!".getBytes()));
 
         // Then
         verify(s3Client).putObject(putObjectRequestCaptor.capture(), requestBodyCaptor.capture());
@@ -47,8 +59,113 @@ class S3UploaderServiceTest {
         PutObjectRequest capturedRequest = putObjectRequestCaptor.getValue();
         assertEquals(bucketName, capturedRequest.bucket());
         assertEquals(key, capturedRequest.key());
+    }
+
+    @Test
+    void shouldUploadLargeStreamInParts() {
+        // Given
+        String bucketName = "test-bucket";
+        String key = "test-key";
+
+        when(s3Client.createMultipartUpload(any(CreateMultipartUploadRequest.class)))
+                .thenReturn(CreateMultipartUploadResponse.builder().uploadId("upload-id").build());
+        when(s3Client.uploadPart(any(UploadPartRequest.class), any(RequestBody.class)))
+                .thenReturn(UploadPartResponse.builder().eTag("etag").build());
+
+        ArgumentCaptor<CompleteMultipartUploadRequest> completeCaptor = ArgumentCaptor.forClass(CompleteMultipartUploadRequest.class);
+
+        // When
+        s3UploaderService.uploadStream(bucketName, key, out -> out.write(new byte[8 * 1024 * 1024 + 1]));
+
+        // Then
+        verify(s3Client, times(2)).uploadPart(any(UploadPartRequest.class), any(RequestBody.class));
+        verify(s3Client).completeMultipartUpload(completeCaptor.capture());
+        verify(s3Client, never()).putObject(any(PutObjectRequest.class), any(RequestBody.class));
+
+        CompleteMultipartUploadRequest completeRequest = completeCaptor.getValue();
+        assertEquals("upload-id", completeRequest.uploadId());
+        assertEquals(2, completeRequest.multipartUpload().parts().size());
+        assertEquals(1, completeRequest.multipartUpload().parts().get(0).partNumber());
+        assertAllBufferPermitsReleased();
+    }
+
+    @Test
+    void shouldUploadStreamAsynchronously() {
+        // Given
+        String bucketName = "test-bucket";
+        String key = "test-key";
+
+        // When
+        s3UploaderService.uploadStreamAsync(bucketName, key, out -> out.write("Hello, S3!".getBytes())).join();
+
+        // Then
+        verify(s3Client).putObject(any(PutObjectRequest.class), any(RequestBody.class));
+        verify(s3Client, never()).createMultipartUpload(any(CreateMultipartUploadRequest.class));
+    }
+
+    @Test
+    void shouldAbortMultipartUploadWhenWriterFails() {
+        // Given
+        String bucketName = "test-bucket";
+        String key = "test-key";
+        when(s3Client.createMultipartUpload(any(CreateMultipartUploadRequest.class)))
+                .thenReturn(CreateMultipartUploadResponse.builder().uploadId("upload-id").build());
+
+        // When
+        assertThrows(UncheckedIOException.class, () -> s3UploaderService.uploadStream(bucketName, key, out -> {
+            out.write(new byte[8 * 1024 * 1024]);
+            throw new IOException("Falha ao gerar o conteúdo");
+        }));
+
+        // Then
+        verify(s3Client).abortMultipartUpload(any(AbortMultipartUploadRequest.class));
+        verify(s3Client, never()).completeMultipartUpload(any(CompleteMultipartUploadRequest.class));
+        assertAllBufferPermitsReleased();
+    }
+
+    @Test
+    void shouldNotPublishObjectWhenWriterClosesStreamAndFails() {
+        // Given
+        String bucketName = "test-bucket";
+        String key = "test-key";
+
+        // When - Um ZipOutputStream fecha o stream de destino mesmo quando falha
+        assertThrows(UncheckedIOException.class, () -> s3UploaderService.uploadStream(bucketName, key, out -> {
+            out.write("conteúdo parcial".getBytes());
+            out.close();
+            throw new UncheckedIOException(new IOException("Falha ao gerar o conteúdo"));
+        }));
+
+        // Then
+        verify(s3Client, never()).putObject(any(PutObjectRequest.class), any(RequestBody.class));
+        assertAllBufferPermitsReleased();
+    }
+
+    @Test
+    void shouldFinishRunningUploadsOnShutdown() {
+        // Given
+        String bucketName = "test-bucket";
+        String key = "test-key";
+        CompletableFuture<Void> upload = s3UploaderService.uploadStreamAsync(bucketName, key, out -> {
+            try {
+                Thread.sleep(200);
+            } catch (InterruptedException e) {
+                throw new InterruptedIOException("Upload interrompido");
+            }
+            out.write("Hello, S3!".getBytes());
+        });
+
+        // When
+        s3UploaderService.shutdown();
+
+        // Then - O upload não é interrompido pelo encerramento
+        assertFalse(upload.isCompletedExceptionally());
+        upload.join();
+        verify(s3Client).putObject(any(PutObjectRequest.class), any(RequestBody.class));
+    }
 
-        // Clean up the temporary file
-        Files.delete(tempFile);
+    private void assertAllBufferPermitsReleased() {
+        Semaphore bufferPermits = (Semaphore) ReflectionTestUtils.getField(s3UploaderService, "bufferPermits");
+        assertEquals(8, bufferPermits.availablePermits());
     }
 }
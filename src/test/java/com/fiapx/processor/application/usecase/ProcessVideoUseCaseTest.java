@@ -9,15 +9,22 @@ import org.junit.jupiter.api.BeforeEach;
 import org.junit.jupiter.api.Test;
 import org.junit.jupiter.api.extension.ExtendWith;
 import org.mockito.ArgumentCaptor;
+import org.mockito.InOrder;
 import org.mockito.InjectMocks;
 import org.mockito.Mock;
+import org.mockito.Spy;
 import org.mockito.junit.jupiter.MockitoExtension;
+import org.springframework.core.task.SyncTaskExecutor;
+import org.springframework.core.task.TaskExecutor;
 import org.springframework.test.util.ReflectionTestUtils;
 
+import java.io.ByteArrayOutputStream;
 import java.io.File;
 import java.util.UUID;
+import java.util.concurrent.CompletableFuture;
 
 import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertThrows;
 import static org.mockito.Mockito.*;
 
 @ExtendWith(MockitoExtension.class)
@@ -33,6 +40,8 @@ class ProcessVideoUseCaseTest {
     private S3UploaderService s3Uploader;
     @Mock
     private S3DownloaderService s3Downloader;
+    @Spy
+    private TaskExecutor statusExecutor = new SyncTaskExecutor();
 
     @InjectMocks
     private ProcessVideoUseCase processVideoUseCase;
@@ -55,23 +64,33 @@ class ProcessVideoUseCaseTest {
 
         File mockDownloadedFile = new File("/tmp/" + videoId + ".mp4");
         File mockImagesDir = new File("/tmp/images");
-        File mockZipFile = new File("/tmp/video.zip");
 
         when(s3Downloader.downloadFile(testBucketName, s3Key)).thenReturn(mockDownloadedFile);
         when(videoProcessing.extractImages(videoId, mockDownloadedFile.getAbsolutePath())).thenReturn(mockImagesDir);
-        when(videoProcessing.createZip(videoId, mockImagesDir)).thenReturn(mockZipFile);
+        when(s3Uploader.uploadStreamAsync(any(), any(), any())).thenReturn(CompletableFuture.completedFuture(null));
 
         ArgumentCaptor<String> s3UrlCaptor = ArgumentCaptor.forClass(String.class);
 
         // When
-        processVideoUseCase.execute(videoId, s3Path, userEmail, contentType);
+        processVideoUseCase.execute(videoId, s3Path, userEmail, contentType).join();
 
         // Then
-        verify(s3Uploader).uploadFile(eq(testBucketName), eq("processed/" + videoId + ".zip"), eq(mockZipFile.getAbsolutePath()));
+        ArgumentCaptor<S3UploaderService.StreamWriter> writerCaptor = ArgumentCaptor.forClass(S3UploaderService.StreamWriter.class);
+        verify(s3Uploader).uploadStreamAsync(eq(testBucketName), eq("processed/" + videoId + ".zip"), writerCaptor.capture());
+        ByteArrayOutputStream zipOutput = new ByteArrayOutputStream();
+        writerCaptor.getValue().writeTo(zipOutput);
+        verify(videoProcessing).writeZip(videoId, mockImagesDir, zipOutput);
+
         verify(videoApi).updateStatus(eq(videoId), eq("COMPLETED"), s3UrlCaptor.capture());
         String expectedS3Url = "https://" + testBucketName + ".s3.amazonaws.com/processed/" + videoId + ".zip";
         assertEquals(expectedS3Url, s3UrlCaptor.getValue());
         verify(notification, never()).sendErrorNotification(any(), any(), any());
+        verify(videoProcessing).cleanup(videoId);
+
+        // PROCESSING é enviado em paralelo ao download, mas sempre antes de COMPLETED
+        InOrder statusOrder = inOrder(videoApi);
+        statusOrder.verify(videoApi).updateStatus(videoId, "PROCESSING", null);
+        statusOrder.verify(videoApi).updateStatus(eq(videoId), eq("COMPLETED"), any());
     }
 
     @Test
@@ -87,12 +106,34 @@ class ProcessVideoUseCaseTest {
         when(s3Downloader.downloadFile(testBucketName, s3Key)).thenThrow(testException);
 
         // When
-        processVideoUseCase.execute(videoId, s3Path, userEmail, contentType);
+        processVideoUseCase.execute(videoId, s3Path, userEmail, contentType).join();
 
         // Then
         verify(videoApi).updateStatus(eq(videoId), eq("ERROR"), eq(null));
         verify(notification).sendErrorNotification(eq(userEmail), eq(videoId), eq(testException.getMessage()));
-        verify(s3Uploader, never()).uploadFile(any(), any(), any());
+        verify(s3Uploader, never()).uploadStreamAsync(any(), any(), any());
+        verify(videoProcessing).cleanup(videoId);
+
+        InOrder statusOrder = inOrder(videoApi);
+        statusOrder.verify(videoApi).updateStatus(videoId, "PROCESSING", null);
+        statusOrder.verify(videoApi).updateStatus(videoId, "ERROR", null);
+    }
+
+    @Test
+    void shouldCleanupWhenErrorHandlingFails() {
+        // Given
+        UUID videoId = UUID.randomUUID();
+        String s3Path = "s3://test-bucket/uploads/" + videoId + ".mp4";
+        String s3Key = "uploads/" + videoId + ".mp4";
+
+        when(s3Downloader.downloadFile(testBucketName, s3Key)).thenThrow(new RuntimeException("Test S3 download error"));
+        doThrow(new RuntimeException("Video API indisponível")).when(videoApi).updateStatus(videoId, "ERROR", null);
+
+        // When
+        assertThrows(RuntimeException.class, () -> processVideoUseCase.execute(videoId, s3Path, "test@example.com", "video/mp4"));
+
+        // Then - Os frames temporários são removidos mesmo assim
+        verify(videoProcessing).cleanup(videoId);
     }
 
     @Test
@@ -106,19 +147,18 @@ class ProcessVideoUseCaseTest {
 
         File mockDownloadedFile = mock(File.class);
         File mockImagesDir = new File("/tmp/images");
-        File mockZipFile = new File("/tmp/video.zip");
 
         when(s3Downloader.downloadFile(testBucketName, s3Key)).thenReturn(mockDownloadedFile);
         when(mockDownloadedFile.getAbsolutePath()).thenReturn("/tmp/test-video.mp4");
         when(videoProcessing.extractImages(videoId, "/tmp/test-video.mp4")).thenReturn(mockImagesDir);
-        when(videoProcessing.createZip(videoId, mockImagesDir)).thenReturn(mockZipFile);
+        when(s3Uploader.uploadStreamAsync(any(), any(), any())).thenReturn(CompletableFuture.completedFuture(null));
         when(mockDownloadedFile.delete()).thenReturn(false); // Simulate deletion failure
 
         // When
-        processVideoUseCase.execute(videoId, s3Path, userEmail, contentType);
+        processVideoUseCase.execute(videoId, s3Path, userEmail, contentType).join();
 
         // Then
-        verify(s3Uploader).uploadFile(eq(testBucketName), eq("processed/" + videoId + ".zip"), eq(mockZipFile.getAbsolutePath()));
+        verify(s3Uploader).uploadStreamAsync(eq(testBucketName), eq("processed/" + videoId + ".zip"), any());
         verify(videoApi).updateStatus(eq(videoId), eq("COMPLETED"), any());
         verify(mockDownloadedFile).delete();
         // Verify that the method completes successfully despite deletion failure
@@ -136,19 +176,18 @@ class ProcessVideoUseCaseTest {
 
         File mockDownloadedFile = mock(File.class);
         File mockImagesDir = new File("/tmp/images");
-        File mockZipFile = new File("/tmp/video.zip");
 
         when(s3Downloader.downloadFile(testBucketName, s3Key)).thenReturn(mockDownloadedFile);
         when(mockDownloadedFile.getAbsolutePath()).thenReturn("/tmp/test-video.mp4");
         when(videoProcessing.extractImages(videoId, "/tmp/test-video.mp4")).thenReturn(mockImagesDir);
-        when(videoProcessing.createZip(videoId, mockImagesDir)).thenReturn(mockZipFile);
+        when(s3Uploader.uploadStreamAsync(any(), any(), any())).thenReturn(CompletableFuture.completedFuture(null));
         when(mockDownloadedFile.delete()).thenReturn(true); // Simulate successful deletion
 
         // When
-        processVideoUseCase.execute(videoId, s3Path, userEmail, contentType);
+        processVideoUseCase.execute(videoId, s3Path, userEmail, contentType).join();
 
         // Then
-        verify(s3Uploader).uploadFile(eq(testBucketName), eq("processed/" + videoId + ".zip"), eq(mockZipFile.getAbsolutePath()));
+        verify(s3Uploader).uploadStreamAsync(eq(testBucketName), eq("processed/" + videoId + ".zip"), any());
         verify(videoApi).updateStatus(eq(videoId), eq("COMPLETED"), any());
         verify(mockDownloadedFile).delete();
         verify(notification, never()).sendErrorNotification(any(), any(), any());
@@ -166,11 +205,38 @@ class ProcessVideoUseCaseTest {
         when(s3Downloader.downloadFile(testBucketName, s3Key)).thenReturn(null);
 
         // When
-        processVideoUseCase.execute(videoId, s3Path, userEmail, contentType);
+        processVideoUseCase.execute(videoId, s3Path, userEmail, contentType).join();
 
         // Then
         verify(videoApi).updateStatus(eq(videoId), eq("ERROR"), eq(null));
         verify(notification).sendErrorNotification(eq(userEmail), eq(videoId), any());
-        verify(s3Uploader, never()).uploadFile(any(), any(), any());
+        verify(s3Uploader, never()).uploadStreamAsync(any(), any(), any());
+    }
+
+    @Test
+    void shouldMarkErrorWhenAsyncUploadFails() {
+        // Given
+        UUID videoId = UUID.randomUUID();
+        String s3Path = "s3://test-bucket/uploads/" + videoId + ".mp4";
+        String s3Key = "uploads/" + videoId + ".mp4";
+        String userEmail = "test@example.com";
+        String contentType = "video/mp4";
+        RuntimeException uploadException = new RuntimeException("Test S3 upload error");
+
+        File mockDownloadedFile = new File("/tmp/" + videoId + ".mp4");
+        File mockImagesDir = new File("/tmp/images");
+
+        when(s3Downloader.downloadFile(testBucketName, s3Key)).thenReturn(mockDownloadedFile);
+        when(videoProcessing.extractImages(videoId, mockDownloadedFile.getAbsolutePath())).thenReturn(mockImagesDir);
+        when(s3Uploader.uploadStreamAsync(any(), any(), any())).thenReturn(CompletableFuture.failedFuture(uploadException));
+
+        // When
+        processVideoUseCase.execute(videoId, s3Path, userEmail, contentType).join();
+
+        // Then
+        verify(videoApi).updateStatus(eq(videoId), eq("ERROR"), eq(null));
+        verify(videoApi, never()).updateStatus(eq(videoId), eq("COMPLETED"), any());
+        verify(notification).sendErrorNotification(eq(userEmail), eq(videoId), eq(uploadException.getMessage()));
+        verify(videoProcessing).cleanup(videoId);
     }
 }
@@ -6,12 +6,14 @@ import org.junit.jupiter.api.extension.ExtendWith;
 import org.mockito.InjectMocks;
 import org.mockito.Mock;
 import org.mockito.junit.jupiter.MockitoExtension;
+import org.springframework.http.client.JdkClientHttpRequestFactory;
 import org.springframework.test.util.ReflectionTestUtils;
 import org.springframework.web.client.RestTemplate;
 
 import java.util.Map;
 import java.util.UUID;
 
+import static org.junit.jupiter.api.Assertions.assertInstanceOf;
 import static org.mockito.ArgumentMatchers.*;
 import static org.mockito.Mockito.*;
 
@@ -50,7 +52,7 @@ class VideoApiAdapterTest {
         videoApiAdapter.updateStatus(videoId, status, storagePath);
 
         // Then
-        verify(restTemplate).postForObject(eq(expectedUrl), any(Map.class), eq(Object.class));
+        verify(restTemplate).postForEntity(eq(expectedUrl), any(Map.class), eq(Void.class));
     }
 
     @Test
@@ -62,7 +64,7 @@ class VideoApiAdapterTest {
         videoApiAdapter.updateStatus(videoId, status, null);
 
         // Then
-        verify(restTemplate).postForObject(eq(expectedUrl), any(Map.class), eq(Object.class));
+        verify(restTemplate).postForEntity(eq(expectedUrl), any(Map.class), eq(Void.class));
     }
 
     @Test
@@ -75,7 +77,7 @@ class VideoApiAdapterTest {
         videoApiAdapter.updateStatus(videoId, differentStatus, storagePath);
 
         // Then
-        verify(restTemplate).postForObject(eq(expectedUrl), any(Map.class), eq(Object.class));
+        verify(restTemplate).postForEntity(eq(expectedUrl), any(Map.class), eq(Void.class));
     }
 
     @Test
@@ -88,7 +90,7 @@ class VideoApiAdapterTest {
         videoApiAdapter.updateStatus(anotherVideoId, status, storagePath);
 
         // Then
-        verify(restTemplate).postForObject(eq(expectedUrl), any(Map.class), eq(Object.class));
+        verify(restTemplate).postForEntity(eq(expectedUrl), any(Map.class), eq(Void.class));
     }
 
     @Test
@@ -100,12 +102,12 @@ class VideoApiAdapterTest {
         videoApiAdapter.updateStatus(videoId, status, storagePath);
 
         // Then
-        verify(restTemplate).postForObject(eq(expectedUrl), argThat(body -> {
+        verify(restTemplate).postForEntity(eq(expectedUrl), argThat(body -> {
             @SuppressWarnings("unchecked")
             Map<String, String> bodyMap = (Map<String, String>) body;
             return status.equals(bodyMap.get("status")) &&
                     storagePath.equals(bodyMap.get("storagePath"));
-        }), eq(Object.class));
+        }), eq(Void.class));
     }
 
     @Test
@@ -118,6 +120,18 @@ class VideoApiAdapterTest {
         videoApiAdapter.updateStatus(videoId, status, emptyStoragePath);
 
         // Then
-        verify(restTemplate).postForObject(eq(expectedUrl), any(Map.class), eq(Object.class));
+        verify(restTemplate).postForEntity(eq(expectedUrl), any(Map.class), eq(Void.class));
     }
-}
\ No newline at end of file
+
+    @Test
+    void shouldUsePooledHttpClientByDefault() {
+        // Given
+        VideoApiAdapter adapter = new VideoApiAdapter();
+
+        // When
+        RestTemplate defaultRestTemplate = (RestTemplate) ReflectionTestUtils.getField(adapter, "restTemplate");
+
+        // Then
+        assertInstanceOf(JdkClientHttpRequestFactory.class, defaultRestTemplate.getRequestFactory());
+    }
+}
@@ -0,0 +1,207 @@
+package com.fiapx.processor.infrastructure.adapter.messaging;
+
+import com.fiapx.processor.infrastructure.config.WorkerProperties;
+import com.rabbitmq.client.AlreadyClosedException;
+import com.rabbitmq.client.Channel;
+import com.rabbitmq.client.ShutdownSignalException;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.extension.ExtendWith;
+import org.mockito.Mock;
+import org.mockito.junit.jupiter.MockitoExtension;
+
+import static org.junit.jupiter.api.Assertions.assertDoesNotThrow;
+import static org.mockito.ArgumentMatchers.anyBoolean;
+import static org.mockito.ArgumentMatchers.anyLong;
+import static org.mockito.Mockito.*;
+
+@ExtendWith(MockitoExtension.class)
+class DeliveryAckBatcherTest {
+
+    private static final int PREFETCH = 10;
+
+    @Mock
+    private Channel channel;
+
+    private DeliveryAckBatcher ackBatcher;
+
+    @BeforeEach
+    void setUp() {
+        lenient().when(channel.isOpen()).thenReturn(true);
+        // Sem start(): nenhum flush periódico concorre com as verificações do teste
+        ackBatcher = new DeliveryAckBatcher(new WorkerProperties(
+                new WorkerProperties.RabbitMq(PREFETCH, 5, 10), new WorkerProperties.S3(50)));
+    }
+
+    @AfterEach
+    void tearDown() {
+        ackBatcher.shutdown();
+    }
+
+    @Test
+    void shouldAckAllCompletedDeliveriesWithSingleMultipleAck() throws Exception {
+        // Given
+        ackBatcher.register(channel, 1L);
+        ackBatcher.register(channel, 2L);
+        ackBatcher.register(channel, 3L);
+
+        // When
+        ackBatcher.complete(channel, 1L);
+        ackBatcher.complete(channel, 2L);
+        ackBatcher.complete(channel, 3L);
+        ackBatcher.flushAll();
+
+        // Then
+        verify(channel).basicAck(3L, true);
+    }
+
+    @Test
+    void shouldNotAckPastLowestInFlightDelivery() throws Exception {
+        // Given
+        ackBatcher.register(channel, 1L);
+        ackBatcher.register(channel, 2L);
+        ackBatcher.register(channel, 3L);
+
+        // When
+        ackBatcher.complete(channel, 2L);
+        ackBatcher.complete(channel, 3L);
+        ackBatcher.flushAll();
+
+        // Then - A entrega 1 ainda está em processamento
+        verify(channel, never()).basicAck(anyLong(), anyBoolean());
+
+        ackBatcher.complete(channel, 1L);
+        ackBatcher.flushAll();
+        verify(channel).basicAck(3L, true);
+    }
+
+    @Test
+    void shouldAckOnlyUpToGapLeftByInFlightDelivery() throws Exception {
+        // Given
+        ackBatcher.register(channel, 1L);
+        ackBatcher.register(channel, 2L);
+        ackBatcher.register(channel, 3L);
+
+        // When
+        ackBatcher.complete(channel, 1L);
+        ackBatcher.complete(channel, 3L);
+        ackBatcher.flushAll();
+
+        // Then
+        verify(channel).basicAck(1L, true);
+        verify(channel, never()).basicAck(3L, true);
+    }
+
+    @Test
+    void shouldFlushWhenBatchIsFull() throws Exception {
+        // Given
+        int batchSize = PREFETCH / 2;
+        for (long tag = 1; tag <= batchSize; tag++) {
+            ackBatcher.register(channel, tag);
+        }
+        for (long tag = 2; tag <= batchSize; tag++) {
+            ackBatcher.complete(channel, tag);
+        }
+        verify(channel, never()).basicAck(anyLong(), anyBoolean());
+
+        // When
+        ackBatcher.complete(channel, 1L);
+
+        // Then
+        verify(channel).basicAck(batchSize, true);
+    }
+
+    @Test
+    void shouldRequeueRejectedDeliveryAndKeepAckingOthers() throws Exception {
+        // Given
+        ackBatcher.register(channel, 1L);
+        ackBatcher.register(channel, 2L);
+
+        // When
+        ackBatcher.reject(channel, 1L);
+        ackBatcher.complete(channel, 2L);
+        ackBatcher.flushAll();
+
+        // Then
+        verify(channel).basicNack(1L, false, true);
+        verify(channel).basicAck(2L, true);
+    }
+
+    @Test
+    void shouldNotAckRejectedLowestDelivery() throws Exception {
+        // Given
+        ackBatcher.register(channel, 1L);
+        ackBatcher.register(channel, 2L);
+        ackBatcher.register(channel, 3L);
+
+        // When
+        ackBatcher.reject(channel, 1L);
+        ackBatcher.complete(channel, 3L);
+        ackBatcher.flushAll();
+
+        // Then - A tag 1 já foi devolvida ao broker e a 2 segue em processamento
+        verify(channel).basicNack(1L, false, true);
+        verify(channel, never()).basicAck(anyLong(), anyBoolean());
+
+        ackBatcher.complete(channel, 2L);
+        ackBatcher.flushAll();
+        verify(channel).basicAck(3L, true);
+    }
+
+    @Test
+    void shouldAckHighestCompletedTagWhenLowerTagWasNeverRegistered() throws Exception {
+        // Given - A tag 1 foi rejeitada pelo container antes de chegar ao consumidor
+        ackBatcher.register(channel, 2L);
+        ackBatcher.register(channel, 3L);
+
+        // When
+        ackBatcher.complete(channel, 2L);
+        ackBatcher.flushAll();
+
+        // Then
+        verify(channel).basicAck(2L, true);
+        verify(channel, never()).basicAck(1L, true);
+    }
+
+    @Test
+    void shouldKeepFlushingAfterAckFailsWithClosedChannel() throws Exception {
+        // Given - O canal fecha entre a checagem isOpen() e o basicAck
+        ShutdownSignalException shutdown = new ShutdownSignalException(false, false, null, channel);
+        doThrow(new AlreadyClosedException(shutdown)).doNothing().when(channel).basicAck(1L, true);
+        ackBatcher.register(channel, 1L);
+        ackBatcher.complete(channel, 1L);
+
+        // When
+        ackBatcher.flushAll();
+        ackBatcher.flushAll();
+
+        // Then - A falha não interrompe os flushes seguintes
+        verify(channel, times(2)).basicAck(1L, true);
+    }
+
+    @Test
+    void shouldNotPropagateNackFailureWithClosedChannel() throws Exception {
+        // Given
+        ShutdownSignalException shutdown = new ShutdownSignalException(false, false, null, channel);
+        doThrow(new AlreadyClosedException(shutdown)).when(channel).basicNack(1L, false, true);
+        ackBatcher.register(channel, 1L);
+
+        // When & Then
+        assertDoesNotThrow(() -> ackBatcher.reject(channel, 1L));
+    }
+
+    @Test
+    void shouldDiscardPendingAcksOfClosedChannel() throws Exception {
+        // Given
+        when(channel.isOpen()).thenReturn(false);
+        ackBatcher.register(channel, 1L);
+        ackBatcher.complete(channel, 1L);
+
+        // When
+        ackBatcher.flushAll();
+
+        // Then
+        verify(channel, never()).basicAck(anyLong(), anyBoolean());
+    }
+}
@@ -1,6 +1,7 @@
 package com.fiapx.processor.infrastructure.adapter.messaging;
 
 import com.fiapx.processor.application.usecase.ProcessVideoUseCase;
+import com.rabbitmq.client.Channel;
 import org.junit.jupiter.api.BeforeEach;
 import org.junit.jupiter.api.Disabled;
 import org.junit.jupiter.api.Test;
@@ -12,6 +13,7 @@ import org.mockito.junit.jupiter.MockitoExtension;
 import java.util.HashMap;
 import java.util.Map;
 import java.util.UUID;
+import java.util.concurrent.CompletableFuture;
 
 import static org.junit.jupiter.api.Assertions.*;
 import static org.mockito.ArgumentMatchers.*;
@@ -20,9 +22,17 @@ import static org.mockito.Mockito.*;
 @ExtendWith(MockitoExtension.class)
 class VideoProcessConsumerTest {
 
+    private static final long DELIVERY_TAG = 1L;
+
     @Mock
     private ProcessVideoUseCase processVideoUseCase;
 
+    @Mock
+    private DeliveryAckBatcher ackBatcher;
+
+    @Mock
+    private Channel channel;
+
     @InjectMocks
     private VideoProcessConsumer videoProcessConsumer;
 
@@ -42,8 +52,11 @@ class VideoProcessConsumerTest {
 
     @Test
     void shouldConsumeValidMessage() {
+        // Given
+        stubSuccessfulExecution();
+
         // When
-        videoProcessConsumer.consume(validMessage);
+        videoProcessConsumer.consume(validMessage, channel, DELIVERY_TAG);
 
         // Then
         verify(processVideoUseCase).execute(
@@ -57,6 +70,7 @@ class VideoProcessConsumerTest {
     @Test
     void shouldHandleMessageWithNullUserEmail() {
         // Given
+        stubSuccessfulExecution();
         Map<String, Object> message = new HashMap<>();
         message.put("id", videoId.toString());
         message.put("storagePath", "/tmp/video.mp4");
@@ -65,7 +79,7 @@ class VideoProcessConsumerTest {
 
         // When & Then - Não deve lançar exceção
         assertDoesNotThrow(() -> {
-            videoProcessConsumer.consume(message);
+            videoProcessConsumer.consume(message, channel, DELIVERY_TAG);
         });
 
         verify(processVideoUseCase).execute(
@@ -79,6 +93,7 @@ class VideoProcessConsumerTest {
     @Test
     void shouldHandleMessageWithNullContentType() {
         // Given
+        stubSuccessfulExecution();
         Map<String, Object> message = new HashMap<>();
         message.put("id", videoId.toString());
         message.put("storagePath", "/tmp/video.mp4");
@@ -87,7 +102,7 @@ class VideoProcessConsumerTest {
 
         // When & Then - Não deve lançar exceção
         assertDoesNotThrow(() -> {
-            videoProcessConsumer.consume(message);
+            videoProcessConsumer.consume(message, channel, DELIVERY_TAG);
         });
 
         verify(processVideoUseCase).execute(
@@ -101,6 +116,7 @@ class VideoProcessConsumerTest {
     @Test
     void shouldHandleMessageWithNullStoragePath() {
         // Given
+        stubSuccessfulExecution();
         Map<String, Object> message = new HashMap<>();
         message.put("id", videoId.toString());
         message.put("storagePath", null);
@@ -109,7 +125,7 @@ class VideoProcessConsumerTest {
 
         // When & Then - Não deve lançar exceção
         assertDoesNotThrow(() -> {
-            videoProcessConsumer.consume(message);
+            videoProcessConsumer.consume(message, channel, DELIVERY_TAG);
         });
 
         verify(processVideoUseCase).execute(
@@ -132,7 +148,7 @@ class VideoProcessConsumerTest {
 
         // When & Then - Should handle gracefully without throwing
         assertDoesNotThrow(() -> {
-            videoProcessConsumer.consume(message);
+            videoProcessConsumer.consume(message, channel, DELIVERY_TAG);
         });
 
         verify(processVideoUseCase, never()).execute(any(), any(), any(), any());
@@ -149,7 +165,7 @@ class VideoProcessConsumerTest {
 
         // When & Then - Should handle gracefully without throwing
         assertDoesNotThrow(() -> {
-            videoProcessConsumer.consume(message);
+            videoProcessConsumer.consume(message, channel, DELIVERY_TAG);
         });
 
         verify(processVideoUseCase, never()).execute(any(), any(), any(), any());
@@ -162,7 +178,7 @@ class VideoProcessConsumerTest {
 
         // When & Then - Should handle gracefully without throwing
         assertDoesNotThrow(() -> {
-            videoProcessConsumer.consume(message);
+            videoProcessConsumer.consume(message, channel, DELIVERY_TAG);
         });
 
         verify(processVideoUseCase, never()).execute(any(), any(), any(), any());
@@ -171,6 +187,7 @@ class VideoProcessConsumerTest {
     @Test
     void shouldHandleMessageWithDifferentDataTypes() {
         // Given
+        stubSuccessfulExecution();
         Map<String, Object> message = Map.of(
             "id", videoId.toString(),
             "storagePath", "/tmp/video.mp4",
@@ -179,7 +196,7 @@ class VideoProcessConsumerTest {
         );
 
         // When
-        videoProcessConsumer.consume(message);
+        videoProcessConsumer.consume(message, channel, DELIVERY_TAG);
 
         // Then
         verify(processVideoUseCase).execute(
@@ -201,9 +218,73 @@ class VideoProcessConsumerTest {
 
         // When & Then - Não deve lançar exceção
         assertDoesNotThrow(() -> {
-            videoProcessConsumer.consume(message);
+            videoProcessConsumer.consume(message, channel, DELIVERY_TAG);
         });
 
         verify(processVideoUseCase, never()).execute(any(), any(), any(), any());
     }
+
+    @Test
+    void shouldAckAfterProcessingCompletes() {
+        // Given
+        CompletableFuture<Void> processing = new CompletableFuture<>();
+        when(processVideoUseCase.execute(any(), any(), any(), any())).thenReturn(processing);
+
+        // When
+        videoProcessConsumer.consume(validMessage, channel, DELIVERY_TAG);
+
+        // Then - A confirmação aguarda o término do upload
+        verify(ackBatcher).register(channel, DELIVERY_TAG);
+        verify(ackBatcher, never()).complete(any(), anyLong());
+        processing.complete(null);
+        verify(ackBatcher).complete(channel, DELIVERY_TAG);
+    }
+
+    @Test
+    void shouldRequeueWhenProcessingFailsUnexpectedly() {
+        // Given
+        when(processVideoUseCase.execute(any(), any(), any(), any()))
+                .thenThrow(new RuntimeException("Video API indisponível"));
+
+        // When
+        videoProcessConsumer.consume(validMessage, channel, DELIVERY_TAG);
+
+        // Then
+        verify(ackBatcher).reject(channel, DELIVERY_TAG);
+        verify(ackBatcher, never()).complete(any(), anyLong());
+    }
+
+    @Test
+    void shouldAckInvalidMessageImmediately() {
+        // When
+        videoProcessConsumer.consume(Map.of("id", "invalid-uuid"), channel, DELIVERY_TAG);
+
+        // Then
+        verify(ackBatcher).complete(channel, DELIVERY_TAG);
+    }
+
+    @Test
+    void shouldAckMessageWithNonStringId() {
+        // When
+        videoProcessConsumer.consume(Map.of("id", 42), channel, DELIVERY_TAG);
+
+        // Then - A tag registrada não pode ficar pendente
+        verify(ackBatcher).register(channel, DELIVERY_TAG);
+        verify(ackBatcher).complete(channel, DELIVERY_TAG);
+        verify(processVideoUseCase, never()).execute(any(), any(), any(), any());
+    }
+
+    @Test
+    void shouldAckMessageWithNonStringOptionalField() {
+        // When
+        videoProcessConsumer.consume(Map.of("id", videoId.toString(), "contentType", 1), channel, DELIVERY_TAG);
+
+        // Then
+        verify(ackBatcher).complete(channel, DELIVERY_TAG);
+        verify(processVideoUseCase, never()).execute(any(), any(), any(), any());
+    }
+
+    private void stubSuccessfulExecution() {
+        when(processVideoUseCase.execute(any(), any(), any(), any())).thenReturn(CompletableFuture.completedFuture(null));
+    }
 }
@@ -4,12 +4,17 @@ import org.junit.jupiter.api.BeforeEach;
 import org.junit.jupiter.api.Test;
 import org.junit.jupiter.api.io.TempDir;
 
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
 import java.io.File;
 import java.io.IOException;
 import java.nio.file.Files;
 import java.nio.file.Path;
+import java.util.ArrayList;
+import java.util.List;
 import java.util.UUID;
-import java.util.zip.ZipFile;
+import java.util.zip.ZipEntry;
+import java.util.zip.ZipInputStream;
 
 import static org.junit.jupiter.api.Assertions.*;
 
@@ -26,7 +31,7 @@ class FFmpegVideoProcessorTest {
     }
 
     @Test
-    void createZipShouldCreateAValidZipFile() throws IOException {
+    void writeZipShouldWriteAValidZip() throws IOException {
         // Given
         UUID videoId = UUID.randomUUID();
         File imagesDir = tempDir.resolve("images").toFile();
@@ -34,56 +39,53 @@ class FFmpegVideoProcessorTest {
 
         // Create some dummy image files
         Files.createFile(imagesDir.toPath().resolve("image1.jpg"));
-        Files.createFile(imagesDir.toPath().resolve("image2.jpg"));
+        Files.write(imagesDir.toPath().resolve("image2.jpg"), new byte[]{1, 2, 3});
+        ByteArrayOutputStream output = new ByteArrayOutputStream();
 
         // When
-        File zipFile = videoProcessor.createZip(videoId, imagesDir);
+        videoProcessor.writeZip(videoId, imagesDir, output);
 
         // Then
-        assertTrue(zipFile.exists());
-        assertTrue(zipFile.length() > 0);
+        assertTrue(output.size() > 0);
 
         // Verify the zip content
-        try (ZipFile zf = new ZipFile(zipFile)) {
-            assertEquals(2, zf.size());
-        }
+        List<ZipEntry> entries = readEntries(output.toByteArray());
+        assertEquals(2, entries.size());
+        // Frames JPEG são armazenados sem recompressão
+        assertTrue(entries.stream().allMatch(entry -> entry.getMethod() == ZipEntry.STORED));
     }
 
     @Test
-    void createZipShouldHandleEmptyDirectory() throws IOException {
+    void writeZipShouldHandleEmptyDirectory() throws IOException {
         // Given
         UUID videoId = UUID.randomUUID();
         File imagesDir = tempDir.resolve("empty-images").toFile();
         imagesDir.mkdir();
+        ByteArrayOutputStream output = new ByteArrayOutputStream();
 
         // When
-        File zipFile = videoProcessor.createZip(videoId, imagesDir);
+        videoProcessor.writeZip(videoId, imagesDir, output);
 
         // Then
-        assertTrue(zipFile.exists());
-
-        try (ZipFile zf = new ZipFile(zipFile)) {
-            assertEquals(0, zf.size());
-        }
+        assertTrue(output.size() > 0);
+        assertEquals(0, readEntries(output.toByteArray()).size());
     }
 
     @Test
-    void createZipShouldHandleUnreadableDirectory() throws IOException {
+    void writeZipShouldHandleUnreadableDirectory() throws IOException {
         // Given
         UUID videoId = UUID.randomUUID();
         File imagesDir = tempDir.resolve("unreadable-images").toFile();
         imagesDir.mkdir();
         // Torna o diretório não legível para simular a falha de listFiles()
         imagesDir.setReadable(false);
+        ByteArrayOutputStream output = new ByteArrayOutputStream();
 
         // When
-        File zipFile = videoProcessor.createZip(videoId, imagesDir);
+        videoProcessor.writeZip(videoId, imagesDir, output);
 
         // Then
-        assertTrue(zipFile.exists());
-        try (ZipFile zf = new ZipFile(zipFile)) {
-            assertEquals(0, zf.size()); // O zip deve ser criado vazio
-        }
+        assertEquals(0, readEntries(output.toByteArray()).size()); // O zip deve ser criado vazio
 
         // Restaura a permissão para permitir a limpeza pelo @TempDir
         imagesDir.setReadable(true);
@@ -107,4 +109,34 @@ class FFmpegVideoProcessorTest {
         assertTrue(outputDir.isDirectory());
         assertTrue(outputDir.getPath().contains(videoId.toString()));
     }
+
+    @Test
+    void cleanupShouldRemoveVideoWorkDirectory() {
+        // Given
+        UUID videoId = UUID.randomUUID();
+        File outputDir = videoProcessor.extractImages(videoId, tempDir.resolve("dummy.mp4").toString());
+
+        // When
+        videoProcessor.cleanup(videoId);
+
+        // Then
+        assertFalse(outputDir.exists());
+        assertFalse(outputDir.getParentFile().exists());
+    }
+
+    @Test
+    void cleanupShouldIgnoreMissingDirectory() {
+        assertDoesNotThrow(() -> videoProcessor.cleanup(UUID.randomUUID()));
+    }
+
+    private List<ZipEntry> readEntries(byte[] zipBytes) throws IOException {
+        List<ZipEntry> entries = new ArrayList<>();
+        try (ZipInputStream zis = new ZipInputStream(new ByteArrayInputStream(zipBytes))) {
+            ZipEntry entry;
+            while ((entry = zis.getNextEntry()) != null) {
+                entries.add(entry);
+            }
+        }
+        return entries;
+    }
 }
@@ -1,10 +1,18 @@
 package com.fiapx.processor.infrastructure.config;
 
+import com.fasterxml.jackson.databind.ObjectMapper;
 import org.junit.jupiter.api.Test;
+import org.msgpack.jackson.dataformat.MessagePackFactory;
 import org.springframework.amqp.core.Queue;
 import org.springframework.amqp.rabbit.config.SimpleRabbitListenerContainerFactory;
 import org.springframework.amqp.rabbit.connection.ConnectionFactory;
+import org.springframework.amqp.core.Message;
+import org.springframework.amqp.core.MessageProperties;
+import org.springframework.amqp.support.converter.MessageConverter;
 import org.springframework.boot.test.context.runner.ApplicationContextRunner;
+import org.springframework.test.util.ReflectionTestUtils;
+
+import java.util.Map;
 
 import static org.assertj.core.api.Assertions.assertThat;
 import static org.mockito.Mockito.mock;
@@ -21,11 +29,78 @@ class RabbitMqConfigTest {
         this.contextRunner.withUserConfiguration(RabbitMqConfig.class)
                 .withBean(ConnectionFactory.class, () -> connectionFactory)
                 .run(context -> {
-                    // Verifica se o Jackson2JsonMessageConverter foi criado
+                    // Verifica se o conversor de mensagens foi criado
                     assertThat(context).hasBean("messageConverter");
                     
                     // Verifica se a Factory de listener foi criada
                     assertThat(context).hasSingleBean(SimpleRabbitListenerContainerFactory.class);
                 });
     }
+
+    @Test
+    void prefetchCountShouldBeConfigurable() {
+        ConnectionFactory connectionFactory = mock(ConnectionFactory.class);
+
+        this.contextRunner.withUserConfiguration(RabbitMqConfig.class)
+                .withBean(ConnectionFactory.class, () -> connectionFactory)
+                .withPropertyValues("worker.rabbitmq.prefetch=25")
+                .run(context -> {
+                    SimpleRabbitListenerContainerFactory factory = context.getBean(SimpleRabbitListenerContainerFactory.class);
+                    assertThat(ReflectionTestUtils.getField(factory, "prefetchCount")).isEqualTo(25);
+                });
+    }
+
+    @Test
+    void consumerConcurrencyShouldBeConfigurable() {
+        ConnectionFactory connectionFactory = mock(ConnectionFactory.class);
+
+        this.contextRunner.withUserConfiguration(RabbitMqConfig.class)
+                .withBean(ConnectionFactory.class, () -> connectionFactory)
+                .withPropertyValues("worker.rabbitmq.concurrency=8", "worker.rabbitmq.max-concurrency=16")
+                .run(context -> {
+                    SimpleRabbitListenerContainerFactory factory = context.getBean(SimpleRabbitListenerContainerFactory.class);
+                    assertThat(ReflectionTestUtils.getField(factory, "concurrentConsumers")).isEqualTo(8);
+                    assertThat(ReflectionTestUtils.getField(factory, "maxConcurrentConsumers")).isEqualTo(16);
+                });
+    }
+
+    @Test
+    void listenerFactoryShouldReuseMessageConverterBean() {
+        ConnectionFactory connectionFactory = mock(ConnectionFactory.class);
+
+        this.contextRunner.withUserConfiguration(RabbitMqConfig.class)
+                .withBean(ConnectionFactory.class, () -> connectionFactory)
+                .run(context -> {
+                    SimpleRabbitListenerContainerFactory factory = context.getBean(SimpleRabbitListenerContainerFactory.class);
+                    assertThat(ReflectionTestUtils.getField(factory, "messageConverter"))
+                            .isSameAs(context.getBean("messageConverter"));
+                });
+    }
+
+    @Test
+    void messageConverterShouldReadJsonAndMsgpackPayloads() {
+        ConnectionFactory connectionFactory = mock(ConnectionFactory.class);
+
+        this.contextRunner.withUserConfiguration(RabbitMqConfig.class)
+                .withBean(ConnectionFactory.class, () -> connectionFactory)
+                .run(context -> {
+                    MessageConverter converter = context.getBean("messageConverter", MessageConverter.class);
+                    Map<String, Object> payload = Map.of("id", "123", "storagePath", "uploads/video.mp4");
+
+                    Object fromJson = converter.fromMessage(message(new ObjectMapper().writeValueAsBytes(payload), MessageProperties.CONTENT_TYPE_JSON));
+                    Object fromMsgpack = converter.fromMessage(message(
+                            new ObjectMapper(new MessagePackFactory()).writeValueAsBytes(payload), RabbitMqConfig.MSGPACK_CONTENT_TYPE));
+
+                    assertThat(fromJson).isEqualTo(payload);
+                    assertThat(fromMsgpack).isEqualTo(payload);
+                });
+    }
+
+    private Message message(byte[] body, String contentType) {
+        MessageProperties properties = new MessageProperties();
+        properties.setContentType(contentType);
+        // Simula o tipo inferido do parâmetro do @RabbitListener
+        properties.setInferredArgumentType(Map.class);
+        return new Message(body, properties);
+    }
 }